@@ -3,14 +3,18 @@
 """
 
 import threading
+import time
 
 from . import meta
 from . import protocol
 from .store import Store
 
 
+_arguments = dict()
 _cache = dict()
 _cache_lock = threading.Lock()
+_registries = tuple()
+_registries_expiration = 0
 
 def _clear(store):
     """ Clear any cached :class:`mktl.Store` instances currently in the cache.
@@ -103,30 +107,52 @@ def get(store, key=None):
     if store is None:
         raise ValueError('the store name must be specified')
 
-    store = str(store)
-    store = store.lower()
+    # Repeated calls with the same arguments are the expected pattern; skip
+    # the string normalization if these arguments were seen before.
 
-    if key is None:
-        if '.' in store:
-            store, key = store.split('.', 1)
+    arguments = (store, key)
+
+    try:
+        store, key = _arguments[arguments]
+    except (KeyError, TypeError):
+        known = False
+
+        store = str(store)
+        store = store.lower()
+
+        if key is None:
+            if '.' in store:
+                store, key = store.split('.', 1)
+        else:
+            key = str(key)
+            key = key.lower()
     else:
-        key = str(key)
-        key = key.lower()
+        known = True
 
     # Work from the in-memory cache of Store instances first. This sequence
     # of checks is replicated at the end of the routine, after all the
     # handling of catalog data.
 
     try:
-        store = _cache[store]
+        cached = _cache[store]
     except KeyError:
         pass
     else:
         if key is None:
-            return store
+            result = cached
         else:
-            key = store[key]
-            return key
+            result = cached[key]
+
+        # Only remember the normalized form of arguments that resulted in a
+        # successful lookup, so that invalid requests cannot grow the cache.
+
+        if known == False:
+            try:
+                _arguments[arguments] = (store, key)
+            except TypeError:
+                pass
+
+        return result
 
     # Start with whatever is available in memory, or the local disk cache.
 
@@ -140,7 +166,7 @@ def get(store, key=None):
 
     if len(catalog) == 0:
         # Nothing valid cached locally. Broadcast for responses.
-        registries = protocol.discover.search()
+        registries = _search()
         if len(registries) == 0:
             raise RuntimeError("no catalog available for '%s' (local or remote)" % (store))
 
@@ -180,6 +206,38 @@ def get(store, key=None):
 
 
 
+def _search():
+    """ This is a helper method for :func:`get` defined in this file. Search
+        for registries on the local network, remembering the results for a
+        short while; each search involves a broadcast, and waits up to a full
+        second if no registries respond. A failed search is remembered for a
+        shorter interval than a successful one, so that a burst of failing
+        :func:`get` calls doesn't turn into a burst of broadcasts, while a
+        newly started registry will still be found promptly.
+    """
+
+    global _registries
+    global _registries_expiration
+
+    now = time.monotonic()
+
+    if now < _registries_expiration:
+        return _registries
+
+    registries = protocol.discover.search()
+
+    if len(registries) == 0:
+        lifetime = 2
+    else:
+        lifetime = 30
+
+    _registries = registries
+    _registries_expiration = now + lifetime
+
+    return registries
+
+
+
 def refresh(catalog):
     """ This is a helper method for :func:`get` defined in this file. The
         *catalog* passed in here was loaded from a file. Inspect the
@@ -188,53 +246,82 @@ def refresh(catalog):
     """
 
     store = catalog.store
+    key = store + '._hash'
+
+    # The response to a _hash request covers every block in the store, and
+    # the same daemons tend to appear in the provenance of many blocks. Send
+    # one request to each distinct daemon up front, so that the requests are
+    # all in flight at the same time, then inspect the responses block by
+    # block below.
+
+    blocks = list()
+    requests = dict()
 
     for uuid in catalog.uuids():
         block = catalog[uuid]
-        local_hash = block['hash']
-        updated = False
-
-        # Make a copy of the provenance sequence, traversing it in reverse
-        # order (highest stratum first) looking for an updated catalog.
 
         try:
             provenance = block['provenance']
         except KeyError:
             # Must be local.
-            return
+            break
+
+        # Make a copy of the provenance sequence, traversing it in reverse
+        # order (highest stratum first) looking for an updated catalog.
 
         provenance = list(provenance)
         provenance.reverse()
+        blocks.append((uuid, block['hash'], provenance))
 
         for stratum in provenance:
             hostname = stratum['hostname']
             rep = stratum['rep']
+            address = (hostname, rep)
+
+            if address in requests:
+                continue
 
-            key = store + '._hash'
             client = protocol.request.client(hostname, rep)
             request = protocol.message.Request('GET', key)
+            client.send(request, wait=False)
 
-            try:
-                client.send(request)
-            except TimeoutError:
-                # No response from this daemon; move on to the next entry in
-                # the provenance. If no daemons respond the client will have
-                # to rely on the local disk cache.
-                continue
+            requests[address] = request
 
-            response = request.wait(timeout=5)
+    # Wait for the acknowledgements only after every request is out, so that
+    # the waits overlap; any number of unresponsive daemons costs a single
+    # request timeout, rather than one timeout apiece.
 
-            if response is None:
-                # No response from this daemon; it's broken somehow. Move on.
-                continue
+    deadline = time.monotonic() + protocol.request.Client.timeout
+
+    for address, request in requests.items():
+        remaining = deadline - time.monotonic()
+
+        if remaining < 0:
+            remaining = 0
+
+        if request.wait_ack(remaining) == False:
+            # No response from this daemon. If no daemons respond the
+            # client will have to rely on the local disk cache.
+            requests[address] = None
+
+    responses = dict()
+
+    for uuid, local_hash, provenance in blocks:
+
+        for stratum in provenance:
+            hostname = stratum['hostname']
+            rep = stratum['rep']
+            address = (hostname, rep)
 
             try:
-                hashes = response.payload.value
-            except AttributeError:
-                hashes = None
+                hashes = responses[address]
+            except KeyError:
+                hashes = _hashes(requests[address])
+                responses[address] = hashes
 
             if hashes is None:
-                # No response available.
+                # No response from this daemon; move on to the next entry in
+                # the provenance.
                 continue
 
             try:
@@ -251,8 +338,8 @@ def refresh(catalog):
 
             if local_hash != remote_hash:
                 # Mismatch; need to request an update before proceeding.
-                key = store + '._catalog'
-                message = protocol.message.Request('GET', key)
+                client = protocol.request.client(hostname, rep)
+                message = protocol.message.Request('GET', store + '._catalog')
                 client.send(message)
                 ### Again, exception handling may be required, though the
                 ### previous request went through, so there shouldn't be a
@@ -280,4 +367,28 @@ def refresh(catalog):
 
 
 
+def _hashes(request):
+    """ This is a helper method for :func:`refresh` defined in this file.
+        Wait for the response to a _hash *request*, and return the hashes
+        it contains; None is returned if there is no usable response.
+    """
+
+    if request is None:
+        return None
+
+    response = request.wait(timeout=5)
+
+    if response is None:
+        # No response from this daemon; it's broken somehow.
+        return None
+
+    try:
+        hashes = response.payload.value
+    except AttributeError:
+        hashes = None
+
+    return hashes
+
+
+
 # vim: set expandtab tabstop=8 softtabstop=4 shiftwidth=4 autoindent:
@@ -716,6 +716,11 @@ class Daemon:
 
 class RequestServer(protocol.request.Server):
 
+    # The largest encoded payload, in bytes, that will be sent as a REP
+    # without a separate ACK; see _req_get_is_immediate().
+
+    immediate_limit = 65536
+
     def __init__(self, daemon, store, *args, **kwargs):
         protocol.request.Server.__init__(self, *args, **kwargs)
         self.daemon = daemon
@@ -729,18 +734,33 @@ class RequestServer(protocol.request.Server):
         self._req_get_handlers['._hash'] = self.req_get_hash
         self._req_get_handlers['_hash'] = self.req_get_hash
 
+        # GET requests for these targets are answered immediately from local
+        # memory. There's no need to send a separate ACK for them: the REP
+        # follows right behind, and the client treats a REP that arrives
+        # first as a combined ACK and REP. The catalog is not included; it
+        # can be large enough that encoding, sending, and decoding it would
+        # not reliably finish within the client's ACK timeout.
+
+        self._req_get_immediate = set()
+        self._req_get_immediate.add(store + '._hash')
+        self._req_get_immediate.add('._hash')
+        self._req_get_immediate.add('_hash')
+
 
     def req_handler(self, request):
         """ Inspect the incoming request type and call an appropriate
             method to handle that specific request.
         """
 
-        if request.ack:
-            self.req_ack(request)
-
         type = request.type
         target = request.target
 
+        if request.ack:
+            if type == 'GET' and request.reply and self._req_get_is_immediate(request):
+                pass
+            else:
+                self.req_ack(request)
+
         if type == 'SET':
             response = self.req_set(request)
         elif type == 'GET':
@@ -754,6 +774,72 @@ class RequestServer(protocol.request.Server):
             return None
 
 
+    def _req_get_is_immediate(self, request):
+        """ Return True if the GET *request* will be answered directly from
+            local memory, in which case the separate ACK can be skipped. In
+            addition to the fixed set of built-in targets, this includes any
+            plain GET of an authoritative item whose :func:`mktl.Item.req_get`
+            is the default implementation, which returns the cached payload
+            from the most recent publish, as long as that payload is small
+            and has no bulk component.
+        """
+
+        target = request.target
+
+        if target in self._req_get_immediate:
+            return True
+
+        if target in self._req_get_handlers:
+            return False
+
+        try:
+            refresh = request.payload.refresh
+        except AttributeError:
+            refresh = False
+
+        if refresh == True:
+            return False
+
+        store, dot, key = target.partition('.')
+
+        if dot == '':
+            return False
+
+        # Avoid instantiating anything here; any unusual case will be
+        # handled, and acknowledged, by the normal path.
+
+        existing = self.daemon.store._items.get(key)
+
+        if existing is None or existing.authoritative != True:
+            return False
+
+        if type(existing).req_get is not item.Item.req_get:
+            return False
+
+        # The client only waits a short time for the ACK, and a REP only
+        # counts as the ACK once all of it has arrived; a bulk value, or any
+        # large value, could take longer than that to transfer. Those still
+        # get a separate ACK.
+
+        payload = existing._daemon_payload
+
+        if payload is None:
+            return False
+
+        try:
+            bulk = payload.bulk
+        except AttributeError:
+            bulk = None
+
+        if bulk is not None:
+            return False
+
+        if len(payload.encapsulate()) > self.immediate_limit:
+            return False
+
+        return True
+
+
     def req_get(self, request):
 
         try:
@@ -766,7 +852,10 @@ class RequestServer(protocol.request.Server):
 
         # Look up the conventional req_get() method for this item.
 
-        store, key = request.target.split('.', 1)
+        store, dot, key = request.target.partition('.')
+
+        if dot == '':
+            raise ValueError('malformed request target: ' + repr(request.target))
 
         if store != self.daemon.store.name:
             raise ValueError("this request is for %s, but this daemon is in %s" % (repr(store), repr(self.daemon.store.name)))
@@ -835,7 +924,10 @@ class RequestServer(protocol.request.Server):
         else:
             return setter(request)
 
-        store, key = request.target.split('.', 1)
+        store, dot, key = request.target.partition('.')
+
+        if dot == '':
+            raise ValueError('malformed request target: ' + repr(request.target))
 
         if store != self.daemon.store.name:
             raise ValueError("this request is for %s, but this daemon is in %s" % (repr(store), repr(self.daemon.store.name)))
@@ -941,26 +1033,30 @@ def _used_ports():
     port_directory = os.path.join(base_directory, 'daemon', 'port')
 
     ports = set()
-    targets = list()
-    targets.append(port_directory)
+    directories = list()
+    directories.append(port_directory)
 
     if os.path.exists(port_directory):
         pass
     else:
         return ports
 
-    for target in targets:
-        if os.path.isdir(target):
-            contents = os.listdir(target)
-            for thing in contents:
-                targets.append(os.path.join(target, thing))
-            continue
+    # The entries returned by os.scandir() already know whether they are
+    # directories, which saves a stat() call for every file in the tree
+    # compared to os.listdir() followed by os.path.isdir().
+
+    for directory in directories:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    directories.append(entry.path)
+                    continue
 
-        port = open(target, 'r').read()
-        port = port.strip()
-        port = int(port)
+                port = open(entry.path, 'rb').read()
+                port = port.strip()
+                port = int(port)
 
-        ports.add(port)
+                ports.add(port)
 
     return ports
 
@@ -990,7 +1086,7 @@ def _load_persistent(store, uuid):
         return loaded
 
     for key in files:
-        if key[:5] == 'bulk:':
+        if key.startswith('bulk:'):
             continue
 
         filename = os.path.join(uuid_directory, key)
@@ -1,5 +1,6 @@
 
 import logging
+import operator
 import queue
 import threading
 import time
@@ -9,6 +10,9 @@ try:
     import numpy
 except ImportError:
     numpy = None
+    _numpy_types = ()
+else:
+    _numpy_types = (numpy.ndarray, numpy.generic)
 
 from . import protocol
 from . import poll
@@ -32,7 +36,7 @@ class Item:
         :ivar publish_on_set: Indicates whether this item will publish a new value whenever :func:`perform_set` is successfully invoked. The default is True.
     """
 
-    untruths = set((None, False, 0, 'false', 'f', 'no', 'n', 'off', 'disable', ''))
+    untruths = frozenset((None, False, 0, 'false', 'f', 'no', 'n', 'off', 'disable', ''))
 
     def __init__(self, store, key):
 
@@ -53,14 +57,14 @@ class Item:
         self._value_timestamp = None
         self._daemon_value = None
         self._daemon_value_timestamp = None
+        self._daemon_payload = None
 
         self.pub = None
         self.sub = None
         self.req = None
         self.rep = None
-        self._update_queue = None
-        self._update_queue_put = None
-        self._update_thread = None
+        self._updater = None
+        self._updater_queued = False
         self._updated = threading.Event()
 
         # An Item is a singleton in practice; enforce that constraint.
@@ -190,9 +194,10 @@ class Item:
             to be replaced; this method facilitates that procedure.
         """
 
-        if self._update_thread is not None:
-            self._update_thread.stop()
-            self._update_thread = None
+        # Any broadcasts still arriving for this instance will be discarded
+        # by _update_enqueue() now that there is no updater.
+
+        self._updater = None
 
         self.callbacks = tuple()
         self.store._items[self.key] = None
@@ -272,10 +277,18 @@ class Item:
 
             shape = payload.shape
             dtype = payload.dtype
-            dtype = getattr(numpy, dtype)
 
-            serialized = numpy.frombuffer(bulk, dtype=dtype)
-            new_value = numpy.reshape(serialized, newshape=shape)
+            try:
+                dtype = _dtypes[dtype]
+            except KeyError:
+                dtype = _dtype(dtype)
+
+            # Construct the array directly on top of the bulk buffer; this is
+            # a view, the bytes are not copied, and avoids the intermediate
+            # one-dimensional array that frombuffer() and reshape() would
+            # otherwise produce.
+
+            new_value = numpy.ndarray(shape, dtype=dtype, buffer=bulk)
 
         else:
             new_value = payload.value
@@ -347,8 +360,7 @@ class Item:
         elif refresh == False:
             request = protocol.message.Request('GET', self.full_key)
         elif refresh == True:
-            payload = protocol.message.Payload(refresh=True)
-            request = protocol.message.Request('GET', self.full_key, payload)
+            request = protocol.message.Request('GET', self.full_key, _refresh)
         else:
             raise TypeError('refresh argument must be a boolean')
 
@@ -358,12 +370,13 @@ class Item:
         if response is None:
             raise RuntimeError('GET failed: no response to request')
 
-        try:
-            error = response.payload.error
-        except AttributeError:
-            error = None
+        # A successful response has no error attribute; use getattr() with a
+        # default rather than raising and catching an AttributeError in
+        # what is expected to be the common case.
 
-        if error is not None and error != '':
+        error = getattr(response.payload, 'error', None)
+
+        if error:
             e_type = error['type']
             e_text = error['text']
 
@@ -556,12 +569,12 @@ class Item:
         payload = self.to_payload(new_value, timestamp)
         changed = False
 
-        if repeat == False:
-            try:
-                bulk = payload.bulk
-            except AttributeError:
-                bulk = None
+        try:
+            bulk = payload.bulk
+        except AttributeError:
+            bulk = None
 
+        if repeat == False:
             if bulk is None:
                 changed = self._daemon_value != new_value
             else:
@@ -578,13 +591,27 @@ class Item:
             self._daemon_value = new_value
             self._daemon_value_timestamp = timestamp
 
+            # The same payload answers every GET request until the next
+            # change; encode it once, and that encoding also serves the
+            # broadcast below. A bulk payload is not kept: it holds a full
+            # copy of the array as bytes, which would double the memory used
+            # for the value. GET requests for a bulk value generate a new
+            # payload instead; see req_get().
+
+            payload.freeze()
+
+            if bulk is None:
+                self._daemon_payload = payload
+            else:
+                self._daemon_payload = None
+
 
         if changed == True or repeat == True:
             key = self.full_key
             message = protocol.message.Broadcast('PUB', key, payload)
 
             # One could bypass the normal broadcast handling internally
-            # within a daemon by putting the message in self._update_queue
+            # within a daemon by passing the message to self._update_enqueue()
             # instead of relying on the full ZeroMQ-based broadcast handling.
             # This would be more efficient, but there is something to be said
             # for fully exercising the normal handling chain in identical
@@ -640,7 +667,10 @@ class Item:
             Callback methods should strive to be lightweight in terms of
             their execution time; any callbacks registered for an item will
             be called in series, and there are no provisions for shortening
-            the queue if a backlog occurs.
+            the queue if a backlog occurs. The background threads invoking
+            callbacks are also shared between items, a small fixed number
+            of them for the whole process; a slow callback will delay the
+            callbacks for any other item that shares its thread.
         """
 
         if callable(method):
@@ -650,6 +680,7 @@ class Item:
 
         reference = weakref.ref(method)
         self.callbacks.append(reference)
+        self._updater_queued = True
 
         if self.subscribed == False:
             self.subscribe()
@@ -690,7 +721,14 @@ class Item:
         if refresh == True:
             payload = self.perform_poll()
         else:
-            payload = self.to_payload()
+            # The payload generated by the most recent publish() represents
+            # the current value; there's no need to generate it again. Bulk
+            # payloads are not kept, see publish().
+
+            payload = self._daemon_payload
+
+            if payload is None:
+                payload = self.to_payload()
 
         return payload
 
@@ -748,7 +786,7 @@ class Item:
         # the contents of the response payload are not inspected.
 
         if response is None:
-            payload = protocol.message.Payload(value=True)
+            payload = _success
         elif isinstance(response, protocol.message.Payload):
             payload = response
         else:
@@ -825,12 +863,13 @@ class Item:
         if response is None:
             raise RuntimeError("SET of %s failed: no response to request" % (self.key))
 
-        try:
-            error = response.payload.error
-        except AttributeError:
-            error = None
+        # A successful response has no error attribute; use getattr() with a
+        # default rather than raising and catching an AttributeError in
+        # what is expected to be the common case.
+
+        error = getattr(response.payload, 'error', None)
 
-        if error is not None and error != '':
+        if error:
             e_type = error['type']
             e_text = error['text']
 
@@ -884,34 +923,15 @@ class Item:
         if self.subscribed == True:
             return
 
-        # A local thread is used to execute callbacks to ensure we don't tie
-        # up the protocol.publish.Client from moving on to the next broadcast.
-        # This does mean there's an extra background thread for every Item
-        # that receives callbacks; on older systems we are limited to 4,000
-        # such threads before running into resource limitations, modern systems
-        # allow 32,000 or more, sometimes depending on the amount of physical
-        # memory in the system.
+        # A background thread is used to execute callbacks to ensure we don't
+        # tie up the protocol.publish.Client from moving on to the next
+        # broadcast. A dedicated thread for every subscribed Item would put a
+        # ceiling on how many items a single process could subscribe to (on
+        # older systems, something like 4,000 threads); instead, a small set
+        # of threads is shared by all items, see _updater() for details.
 
-        # A thread pool might be just as performant for this purpose, but the
-        # control flow in that thread would be a lot more complex. Having a
-        # dedicated _Updater background thread for each Item with an active
-        # subscription makes the processing straightforward.
-
-        # The reference to SimpleQueue.put() gets deallocated immediately if we
-        # don't keep a local reference; the weak reference used in register()
-        # (despite using a weak method wrapper) doesn't function once it goes
-        # out of scope.
-
-        try:
-            # Available in Python 3.7+.
-            self._update_queue = queue.SimpleQueue()
-        except AttributeError:
-            self._update_queue = queue.Queue()
-
-        self._update_queue_put = self._update_queue.put
-        self._update_thread = _Updater(self._update, self._update_queue)
-
-        self.sub.register(self._update_queue_put, self.full_key)
+        self._updater = _updater(self.full_key)
+        self.sub.register(self._update_enqueue, self.full_key)
         self.subscribed = True
 
         if prime == True:
@@ -993,15 +1013,17 @@ class Item:
         # description? Or does an attribute need to be set to make the
         # expected behavior explicit?
 
-        try:
+        # Only numpy values are treated as bulk data. Checking the type is
+        # cheap, where probing for a tobytes() method raises and catches an
+        # AttributeError for every scalar value, the common case.
+
+        if isinstance(value, _numpy_types):
             bulk = value.tobytes()
-        except AttributeError:
-            bulk = None
-            payload = protocol.message.Payload(value=value, time=timestamp, **kwargs)
-        else:
             shape = value.shape
             dtype = str(value.dtype)
             payload = protocol.message.Payload(time=timestamp, bulk=bulk, shape=shape, dtype=dtype, **kwargs)
+        else:
+            payload = protocol.message.Payload(value=value, time=timestamp, **kwargs)
 
         return payload
 
@@ -1138,13 +1160,21 @@ class Item:
             See also :py:attr:`formatted` and :py:attr:`quantity`.
         """
 
-        if self.authoritative == True:
+        # This property is the common path for every arithmetic and
+        # comparison operator defined below; keep the number of attribute
+        # lookups to a minimum, the cached value is only looked up once
+        # unless a refresh is required.
+
+        if self.authoritative:
             return self._daemon_value
 
-        if self._value is None:
+        current = self._value
+
+        if current is None:
             self.get(refresh=True)
+            current = self._value
 
-        return self._value
+        return current
 
 
     @value.setter
@@ -1169,20 +1199,18 @@ class Item:
 
     def _propagate(self, new_data, new_timestamp):
         """ Invoke any registered callbacks upon receipt of a new value.
+            The caller is expected to check whether there are any callbacks
+            before invoking this method.
         """
 
-        if self.callbacks:
-            pass
-        else:
-            return
-
-        invalid = list()
+        invalid = False
 
         for reference in self.callbacks:
             callback = reference()
 
             if callback is None:
-                invalid.append(reference)
+                invalid = True
+                continue
 
             try:
                 callback(self, new_data, new_timestamp)
@@ -1192,8 +1220,36 @@ class Item:
                 logger.exception(message, self.full_key)
                 continue
 
-        for reference in invalid:
-            self.callbacks.remove(reference)
+        # Removing dead references one at a time is a linear search for each
+        # one; pruning the list is a single pass regardless of how many
+        # references went away. A weakref.WeakSet can't be used here, it will
+        # not hold a bound method, which is the most common type of callback.
+
+        if invalid:
+            weakref.prune(self.callbacks)
+
+
+    def _update_enqueue(self, message):
+        """ Hand a newly arrived broadcast to the background thread that
+            handles updates for this item, which will eventually invoke
+            :func:`_update`.
+        """
+
+        updater = self._updater
+
+        if updater is None:
+            return
+
+        # Until a callback is registered there is nothing to be gained by
+        # handing the update to a background thread: all that happens is
+        # the local cache being updated, which is fast, and can be done
+        # directly. Once a callback is registered the handling will always
+        # be queued, so that updates are never handled out of order.
+
+        if self._updater_queued:
+            updater.put((self._update, message))
+        else:
+            self._update(message)
 
 
     def _update(self, message):
@@ -1212,22 +1268,26 @@ class Item:
         self._value = new_value
         self._value_timestamp = timestamp
         self._updated.set()
-        self._propagate(new_value, timestamp)
+
+        # Most items never have callbacks registered; skip the method call
+        # entirely for those.
+
+        if self.callbacks:
+            self._propagate(new_value, timestamp)
 
 
     def __bool__(self):
         current = self.value
 
+        # The string entries in the untruths set are all lowercase; a string
+        # value only needs to be lowered once, and then a single membership
+        # test covers every case.
+
+        if isinstance(current, str):
+            current = current.lower()
+
         if current in self.untruths:
             return False
-        else:
-            try:
-                lower = current.lower()
-            except AttributeError:
-                return True
-
-            if lower in self.untruths:
-                return False
 
         return True
 
@@ -1260,47 +1320,8 @@ class Item:
         return str(self.formatted)
 
 
-    def __lt__(self, other):
-        return self.value < other
-
-    def __le__(self, other):
-        return self.value <= other
-
-    def __eq__(self, other):
-        return self.value == other
-
-    def __ne__(self, other):
-        return self.value != other
-
-    def __gt__(self, other):
-        return self.value > other
-
-    def __ge__(self, other):
-        return self.value >= other
-
-    def __add__(self, other):
-        return self.value + other
-
-    def __radd__(self, other):
-        return other + self.value
-
-    def __sub__(self, other):
-        return self.value - other
-
-    def __rsub__(self, other):
-        return other - self.value
-
-    def __mul__(self, other):
-        return self.value * other
-
-    def __rmul__(self, other):
-        return other * self.value
-
-    def __div__(self, other):
-        return self.value / other
-
-    def __rdiv__(self, other):
-        return other / self.value
+    # The bulk of the comparison and arithmetic operators are attached to
+    # the class after it is defined, see _binary_operators below.
 
     def __truediv__(self, other):
         current = float(self.value)
@@ -1310,30 +1331,12 @@ class Item:
         current = float(self.value)
         return other / current
 
-    def __mod__(self, other):
-        return self.value % other
-
-    def __rmod__(self, other):
-        return other % self.value
-
-    def __floordiv__(self, other):
-        return self.value // other
-
-    def __rfloordiv__(self, other):
-        return other // self.value
-
     def __divmod__(self, other):
         return (self.value // other, self % other)
 
     def __rdivmod__(self, other):
         return (other // self.value, other % self)
 
-    def __pow__(self, other):
-        return self.value ** other
-
-    def __rpow__(self, other):
-        return other ** self.value
-
     def __neg__(self):
         return -self.value
 
@@ -1346,24 +1349,6 @@ class Item:
     def __invert__(self):
         return ~self.value
 
-    def __and__(self, other):
-        return self.value & other
-
-    def __rand__(self, other):
-        return other & self.value
-
-    def __or__(self, other):
-        return self.value | other
-
-    def __ror__(self, other):
-        return other | self.value
-
-    def __xor__(self, other):
-        return self.value ^ other
-
-    def __rxor__(self, other):
-        return other ^ self.value
-
 
     def __inplace(self, method, value):
 
@@ -1418,8 +1403,80 @@ class Item:
 
 
 
-class _UpdaterWake(RuntimeError):
-    pass
+def _binary(operation):
+    """ Return a method that applies *operation* to the current value of an
+        :class:`Item` and the other operand, in that order.
+    """
+
+    def method(self, other):
+        return operation(self.value, other)
+
+    return method
+
+
+def _reflected(operation):
+    """ Return a method that applies *operation* to the other operand and the
+        current value of an :class:`Item`, in that order; this is the form
+        used for the reflected operators, such as __radd__.
+    """
+
+    def method(self, other):
+        return operation(other, self.value)
+
+    return method
+
+
+# The Item operators all share the same form: retrieve the current value,
+# and hand it to the corresponding operation. Rather than repeat the same
+# method definition for each one, they are generated from these tables.
+
+_binary_operators = {
+    'lt': operator.lt,
+    'le': operator.le,
+    'eq': operator.eq,
+    'ne': operator.ne,
+    'gt': operator.gt,
+    'ge': operator.ge,
+    'add': operator.add,
+    'sub': operator.sub,
+    'mul': operator.mul,
+    'div': operator.truediv,
+    'mod': operator.mod,
+    'floordiv': operator.floordiv,
+    'pow': operator.pow,
+    'and': operator.and_,
+    'or': operator.or_,
+    'xor': operator.xor,
+}
+
+_reflected_operators = {
+    'radd': operator.add,
+    'rsub': operator.sub,
+    'rmul': operator.mul,
+    'rdiv': operator.truediv,
+    'rmod': operator.mod,
+    'rfloordiv': operator.floordiv,
+    'rpow': operator.pow,
+    'rand': operator.and_,
+    'ror': operator.or_,
+    'rxor': operator.xor,
+}
+
+for name, operation in _binary_operators.items():
+    name = '__' + name + '__'
+    method = _binary(operation)
+    method.__name__ = name
+    method.__qualname__ = 'Item.' + name
+    setattr(Item, name, method)
+
+for name, operation in _reflected_operators.items():
+    name = '__' + name + '__'
+    method = _reflected(operation)
+    method.__name__ = name
+    method.__qualname__ = 'Item.' + name
+    setattr(Item, name, method)
+
+
 
 
 class _Updater:
@@ -1427,13 +1484,23 @@ class _Updater:
         event processing loop sitting on the ZeroMQ socket to be consistent
         and tight, where a user-provided callback may require an unbounded
         amount of time to process.
+
+        An :class:`_Updater` is shared by many :class:`Item` instances; the
+        queue contains (method, message) pairs, and each method is invoked
+        with its message in the order they arrived. A callback that takes a
+        long time to run holds up the updates for every other item assigned
+        to the same :class:`_Updater`, not just its own; see :func:`_updater`.
     """
 
-    def __init__(self, method, queue):
+    def __init__(self):
 
-        self.method = method
-        self.queue = queue
-        self.shutdown = False
+        try:
+            # Available in Python 3.7+.
+            self.queue = queue.SimpleQueue()
+        except AttributeError:
+            self.queue = queue.Queue()
+
+        self.put = self.queue.put
 
         self.thread = threading.Thread(target=self.run)
         self.thread.daemon = True
@@ -1442,31 +1509,89 @@ class _Updater:
 
     def run(self):
 
+        get = self.queue.get
+
         while True:
-            if self.shutdown == True:
-                break
+            method, message = get()
+
+            # This thread is shared; one misbehaving item cannot be allowed
+            # to halt the processing for all the others.
 
             try:
-                dequeued = self.queue.get(timeout=300)
-            except queue.Empty:
-                continue
+                method(message)
+            except:
+                logger = logging.getLogger(__name__)
+                logger.exception('update failed:')
 
-            if isinstance(dequeued, _UpdaterWake):
-                continue
 
-            self.method(dequeued)
+    def put(self, *args, **kwargs):
+        """ The reference to this method is replaced when initialization
+            occurs.
+        """
+
+        return self.queue.put(*args, **kwargs)
 
 
-    def stop(self):
-        self.shutdown = True
-        self.wake()
+# end of class _Updater
 
 
-    def wake(self):
-        self.queue.put(_UpdaterWake())
 
+# The payload for a GET request with refresh set is always the same, as is
+# the default response to a successful SET request; neither is modified after
+# it is created, so share one instance of each across all requests.
 
-# end of class Updater
+_refresh = protocol.message.Payload(refresh=True)
+_refresh.freeze()
+_success = protocol.message.Payload(value=True)
+_success.freeze()
+
+
+_dtypes = dict()
+
+
+def _dtype(name):
+    """ Return the numpy dtype corresponding to the string *name*, as found
+        in the payload of a bulk value. The result is cached in the _dtypes
+        dictionary, so that a stream of bulk values, which are almost always
+        of the same type, do not need to resolve the same name repeatedly.
+    """
+
+    dtype = numpy.dtype(name)
+    _dtypes[name] = dtype
+    return dtype
+
+
+
+_updater_count = 16
+_updaters = [None] * _updater_count
+_updaters_lock = threading.Lock()
+
+
+def _updater(key):
+    """ Return the :class:`_Updater` instance responsible for the item with
+        the specified *key*. A small, fixed number of background threads is
+        shared across all items, as opposed to one thread per item; each
+        thread is started the first time an item mapping to it needs one.
+        An item's key always maps to the same thread, so updates for any one
+        item are still handled in the order they arrived, even if the item
+        instance is replaced.
+    """
+
+    index = hash(key) % _updater_count
+    updater = _updaters[index]
+
+    if updater is None:
+        _updaters_lock.acquire()
+
+        try:
+            updater = _updaters[index]
+            if updater is None:
+                updater = _Updater()
+                _updaters[index] = updater
+        finally:
+            _updaters_lock.release()
+
+    return updater
 
 
 ### Additional subclasses would go here, if they existed. Numeric types, bulk
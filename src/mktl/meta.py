@@ -83,6 +83,17 @@ class Catalog:
         # This relies on the assumption that there will never be a key name
         # matching a UUID. This seems like a safe assumption...
 
+        # The overwhelming majority of lookups come from Item instances, and
+        # the conversion methods below, which always use the already-lowered
+        # key for the item. Try that first, before allocating a lowercase copy.
+
+        try:
+            item = self._by_key[key]
+        except KeyError:
+            pass
+        else:
+            return item
+
         key = key.lower()
 
         try:
@@ -1315,13 +1326,19 @@ def announce(catalog, uuid, override=False):
     if override == True:
         block['override'] = True
 
-    payload = protocol.message.Payload(value=block)
-    payload.add_origin()
-    message = protocol.message.Request('SET', '_catalog', payload)
+    # The same payload goes to every registry; encode it once. Each registry
+    # needs its own Request, though: a Request tracks the acknowledgement and
+    # response for a single exchange.
+
+    announcement = protocol.message.Payload(value=block)
+    announcement.add_origin()
+    announcement.freeze()
 
     registries = protocol.discover.search(wait=True)
 
     for address,port in registries:
+        message = protocol.message.Request('SET', '_catalog', announcement)
+
         try:
             payload = protocol.request.send(address, port, message)
         except TimeoutError:
@@ -1511,8 +1528,13 @@ def generate_hash(dumpable):
 
     raw_json = json.dumps(dumpable)
 
-    hash = hashlib.shake_256(raw_json)
-    hash = int(hash.hexdigest(16), 16)
+    # BLAKE2 is part of the standard library and considerably faster than
+    # the SHA-3 family; asking for a 16 byte digest directly, and converting
+    # it to an integer without a hexadecimal round trip, yields the same
+    # 128 bit range as before.
+
+    hash = hashlib.blake2b(raw_json, digest_size=16)
+    hash = int.from_bytes(hash.digest(), byteorder='big')
     return hash
 
 
@@ -150,12 +150,14 @@ class Message:
         try:
             id.decode
         except AttributeError:
-            id = '%08x' % (id)
-            id = id.encode()
+            id = b'%08x' % (id)
 
         type = type.encode()
 
-        if target ==  None or target == '':
+        # An absent target is either None or the empty string; both are
+        # false, as is an empty byte sequence.
+
+        if not target:
             target = b''
         else:
             try:
@@ -306,10 +308,16 @@ class Broadcast(Message):
         payload = self.payload
 
         # The PUB/SUB topic has a trailing dot to prevent leading
-        # substring matches from picking up extra keys.
+        # substring matches from picking up extra keys. A daemon publishes
+        # the same handful of keys over and over; remember the encoded form.
 
-        target = target + '.'
-        target = target.encode()
+        try:
+            target = _topics[target]
+        except KeyError:
+            topic = target + '.'
+            topic = topic.encode()
+            _topics[target] = topic
+            target = topic
 
         if payload is None or payload == '':
             bulk = None
@@ -377,6 +385,68 @@ class Broadcast(Message):
 
 
 
+# Cache of encoded PUB/SUB topics used by Broadcast._finalize(). The number
+# of distinct topics is bounded by the number of keys a daemon serves.
+
+_topics = dict()
+
+
+
+class _Event:
+    """ A minimal substitute for :class:`threading.Event`, built on a single
+        lock that is held until the event is set. Creating a
+        :class:`threading.Event` is expensive relative to the rest of a
+        :class:`Request`, since it builds a full :class:`threading.Condition`;
+        a :class:`Request` needs two of them.
+
+        Unlike :class:`threading.Event` the event cannot be cleared, and
+        :func:`set` must only be called from one thread; for a
+        :class:`Request` that is the thread handling responses in
+        :class:`mktl.protocol.request.Client`. Any number of threads can
+        call :func:`wait`.
+    """
+
+    __slots__ = ('flag', 'lock')
+
+    def __init__(self):
+        self.flag = False
+        self.lock = threading.Lock()
+        self.lock.acquire()
+
+
+    def is_set(self):
+        return self.flag
+
+
+    def set(self):
+        if self.flag:
+            return
+
+        self.flag = True
+        self.lock.release()
+
+
+    def wait(self, timeout=None):
+        if self.flag:
+            return True
+
+        if timeout is None:
+            timeout = -1
+        elif timeout < 0:
+            timeout = 0
+
+        # Pass the lock along to the next waiter, if any.
+
+        if self.lock.acquire(True, timeout):
+            self.lock.release()
+
+        return self.flag
+
+
+# end of class _Event
+
+
+
 class Request(Message):
     """ A :class:`Request` has a little extra functionality, focusing on
         local caching of response values and signaling that a request is
@@ -408,8 +478,8 @@ class Request(Message):
 
         self.response = None
 
-        self.ack_event = threading.Event()
-        self.rep_event = threading.Event()
+        self.ack_event = _Event()
+        self.rep_event = _Event()
 
 
     def __repr__(self):
@@ -450,7 +520,7 @@ class Request(Message):
 
     def wait_ack(self, timeout):
         """ Block until the request has been acknowledged. This is a wrapper to
-            a :class:`threading.Event` instance; if the event has occurred it
+            an event instance; if the event has occurred it
             will return True, otherwise it returns False after the requested
             *timeout*. If the *timeout* argument is None it will block
             indefinitely.
@@ -490,7 +560,8 @@ class Payload:
         :ivar omit: A set of fields to omit from encapsulation
     """
 
-    omit = set(('bulk', 'omit'))
+    omit = set(('bulk', 'omit', '_encapsulated'))
+    _encapsulated = None
 
     def __init__(self, **kwargs):
         """ Arbitrary keyword arguments are allowed when creating a
@@ -532,9 +603,11 @@ class Payload:
                 b'{"value": 12, "time": 1761100609.234571}'
         """
 
-        # The output from this method was initially cached, but there's never
-        # a situation where this method is called twice for a given Payload,
-        # so the caching was removed.
+        # The output from this method is not cached unless the Payload has
+        # been frozen; see :func:`freeze`.
+
+        if self._encapsulated is not None:
+            return self._encapsulated
 
         payload = dict()
 
@@ -562,35 +635,63 @@ class Payload:
         return payload
 
 
+    def freeze(self):
+        """ Encapsulate this :class:`Payload` now, and return that same result
+            for all future calls to :func:`encapsulate`. This is for a
+            :class:`Payload` that will be put on the wire repeatedly, such as
+            the payload a daemon uses to answer every GET request between
+            broadcasts; the :class:`Payload` must not be modified afterward.
+        """
+
+        self._encapsulated = None
+        self._encapsulated = self.encapsulate()
+
+
 # end of class Payload
 
 
 _id_min = 0
 _id_max = 0xFFFFFFFF
-_id_lock = threading.Lock()
 _id_ticker = itertools.count(_id_min)
 
+# Advancing an itertools.count instance is a single C-level operation, which
+# is atomic as long as the global interpreter lock is in place; a lock is only
+# required for a free-threaded interpreter.
+
+try:
+    _gil = sys._is_gil_enabled()
+except AttributeError:
+    # Available in Python 3.13+; earlier versions always have the lock.
+    _gil = True
+
+if _gil:
+    _id_lock = None
+else:
+    _id_lock = threading.Lock()
+
 
 def _id_next():
     """ Return the next request identification number for subroutines to
         use when constructing a message.
     """
 
-    global _id_ticker
-    _id_lock.acquire()
-    id = next(_id_ticker)
-
-    if id >= _id_max:
-        _id_ticker = itertools.count(_id_min)
+    # The identification number is a 32-bit unsigned integer. Rather than
+    # checking for overflow and resetting the ticker, let the ticker count
+    # upward forever and mask off everything beyond the lower 32 bits; the
+    # resulting sequence wraps around to zero on its own.
 
-        if id > _id_max:
-            # This shouldn't happen, but here we are...
-            id = next(_id_ticker)
+    if _id_lock is None:
+        id = next(_id_ticker)
+    else:
+        _id_lock.acquire()
+        id = next(_id_ticker)
+        _id_lock.release()
 
-    _id_lock.release()
+    # Format directly to bytes, rather than formatting a string and then
+    # encoding it.
 
-    id = '%08x' % (id)
-    id = id.encode()
+    id = id & _id_max
+    id = b'%08x' % (id)
     return id
 
 
@@ -16,7 +16,14 @@ from . import message
 
 minimum_port = 10139
 maximum_port = 13679
-zmq_context = zmq.Context()
+
+# The publish and request modules share a single ZeroMQ context; a separate
+# context per module means a separate set of background I/O threads per
+# module. The default is a single I/O thread, which becomes the bottleneck
+# when a process is both publishing bulk data and handling requests. The
+# io_threads argument only takes effect when the shared instance is created.
+
+zmq_context = zmq.Context.instance(io_threads=2)
 
 
 class Client:
@@ -35,25 +42,12 @@ class Client:
 
         self.callback_all = list()
         self.callback_specific = dict()
-        self.shutdown = False
 
-        try:
-            # Available in Python 3.7+.
-            self.subscriptions = queue.SimpleQueue()
-        except AttributeError:
-            self.subscriptions = queue.Queue()
+        # A single background thread handles the SUB sockets for all Client
+        # instances; see _receiver() for details.
 
-        internal = "inproc://publish.Client:signal:%s:%d" % (address, port)
-        self.subscription_address = internal
-        self.subscription_receive = zmq_context.socket(zmq.PAIR)
-        self.subscription_receive.bind(internal)
-
-        self.subscription_signal = zmq_context.socket(zmq.PAIR)
-        self.subscription_signal.connect(internal)
-
-        self.thread = threading.Thread(target=self.run)
-        self.thread.daemon = True
-        self.thread.start()
+        self.receiver = _receiver()
+        self.receiver.add(self)
 
 
     def propagate(self, message):
@@ -61,35 +55,14 @@ class Client:
             a newly arrived message.
         """
 
-        # Do nothing if nobody is listening.
-
-        if self.callback_all or self.callback_specific:
-            pass
-        else:
-            return
-
-
         # Handle the case where a callback is registered for any/all messages.
+        # Most clients only have topic-specific callbacks, skip straight past
+        # this step if that's the case.
 
-        invalid = list()
         references = self.callback_all
 
-        for reference in references:
-            callback = reference()
-
-            if callback is None:
-                invalid.append(reference)
-                continue
-
-            try:
-                callback(message)
-            except:
-                print(traceback.format_exc())
-                continue
-
-        for reference in invalid:
-            references.remove(reference)
-
+        if references:
+            self._invoke(references, message)
 
         # Handle the case where a callback is registered for a specific topic.
         # If there are no topic-specific callbacks, no further processing is
@@ -102,18 +75,33 @@ class Client:
 
         topic = message.target
 
-        try:
-            references = self.callback_specific[topic]
-        except KeyError:
+        # A miss is routine here if there are any callbacks registered for
+        # all topics, since every broadcast is then received; avoid raising
+        # a KeyError for each one.
+
+        references = self.callback_specific.get(topic)
+
+        if references is None:
             return
 
-        invalid = list()
+        self._invoke(references, message)
+
+        if len(references) == 0:
+            del self.callback_specific[topic]
+
+
+    def _invoke(self, references, message):
+        """ Invoke the callbacks in the supplied list of weak *references*
+            for this *message*, pruning any dead references from the list.
+        """
+
+        invalid = False
 
         for reference in references:
             callback = reference()
 
             if callback is None:
-                invalid.append(reference)
+                invalid = True
                 continue
 
             try:
@@ -122,11 +110,8 @@ class Client:
                 print(traceback.format_exc())
                 continue
 
-        for reference in invalid:
-            references.remove(reference)
-
-        if len(references) == 0:
-            del self.callback_specific[topic]
+        if invalid:
+            weakref.prune(references)
 
 
     def register(self, callback, topic=None):
@@ -157,32 +142,30 @@ class Client:
             topic = topic + '.'
             topic = topic.encode()
 
-            try:
-                callbacks = self.callback_specific[topic]
-            except:
-                callbacks = list()
-                self.callback_specific[topic] = callbacks
-
+            callbacks = self.callback_specific.setdefault(topic, list())
             callbacks.append(reference)
             self.subscribe(topic)
 
 
-    def run(self):
+    def _pub_drain(self):
+        """ Receive and handle every broadcast already queued on the socket.
+            Broadcasts tend to arrive in bursts; draining the socket here
+            means one poll() call covers the whole burst, as opposed to one
+            poll() call per broadcast. The number of broadcasts handled in
+            one pass is capped so that a steady flood of broadcasts cannot
+            starve the handling of new subscriptions, or the broadcasts
+            arriving for other :class:`Client` instances.
+        """
 
-        poller = zmq.Poller()
-        poller.register(self.socket, zmq.POLLIN)
-        poller.register(self.subscription_receive, zmq.POLLIN)
+        receive = self.socket.recv_multipart
 
-        while self.shutdown == False:
-            sockets = poller.poll(10000) # milliseconds
-            for active,flag in sockets:
-
-                if self.socket == active:
-                    parts = self.socket.recv_multipart()
-                    self._pub_incoming(parts)
+        for ignored in range(1000):
+            try:
+                parts = receive(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                break
 
-                elif self.subscription_receive == active:
-                    self._sub_incoming()
+            self._pub_incoming(parts)
 
 
     def _pub_incoming(self, parts):
@@ -199,17 +182,6 @@ class Client:
         self.propagate(broadcast)
 
 
-    def _sub_incoming(self):
-        """ Clear one subscription notification and handle one subscription
-            request.
-        """
-
-        self.subscription_receive.recv(flags=zmq.NOBLOCK)
-        topic = self.subscriptions.get(block=False)
-
-        self.socket.setsockopt(zmq.SUBSCRIBE, topic)
-
-
     def subscribe(self, topic):
         """ ZeroMQ subscriptions are based on a topic. Filtering of messages
             happens on the server side, depending on what a client is subscribed
@@ -223,17 +195,148 @@ class Client:
             topic = str(topic)
             topic = topic.encode()
 
-        self.subscriptions.put(topic)
-        self.subscription_signal.send(b'')
+        self.receiver.subscribe(self, topic)
 
 
 # end of class Client
 
 
 
+class _Receiver:
+    """ Background thread to receive broadcasts on behalf of any number of
+        :class:`Client` instances. A single poll() call covers the SUB sockets
+        for all of them; as with all ZeroMQ sockets, once a SUB socket is
+        handed to this thread, all further operations on it, including
+        changes to its subscriptions, happen here.
+    """
+
+    def __init__(self):
+
+        self.clients = dict()
+        self.poller = zmq.Poller()
+
+        try:
+            # Available in Python 3.7+.
+            self.requests = queue.SimpleQueue()
+        except AttributeError:
+            self.requests = queue.Queue()
+
+        internal = "inproc://publish._Receiver:signal:%d" % (id(self))
+        self.request_address = internal
+        self.request_receive = zmq_context.socket(zmq.PAIR)
+        self.request_receive.bind(internal)
+
+        # The signal socket is shared by every thread requesting a change,
+        # and a ZeroMQ socket cannot safely be used by multiple threads at
+        # once; the lock serializes the send() calls.
+
+        self.request_signal = zmq_context.socket(zmq.PAIR)
+        self.request_signal.connect(internal)
+        self.request_lock = threading.Lock()
+
+        self.poller.register(self.request_receive, zmq.POLLIN)
+
+        self.thread = threading.Thread(target=self.run)
+        self.thread.daemon = True
+        self.thread.start()
+
+
+    def add(self, client):
+        """ Begin receiving broadcasts on behalf of the supplied *client*.
+        """
+
+        self._request(client, None)
+
+
+    def subscribe(self, client, topic):
+        """ Subscribe the SUB socket of the supplied *client* to the
+            specified *topic*, which must already be encoded as bytes.
+        """
+
+        self._request(client, topic)
+
+
+    def _request(self, client, topic):
+
+        self.requests.put((client, topic))
+
+        self.request_lock.acquire()
+        try:
+            self.request_signal.send(b'')
+        finally:
+            self.request_lock.release()
+
+
+    def _request_incoming(self):
+        """ Clear one request notification and handle one request.
+        """
+
+        self.request_receive.recv(flags=zmq.NOBLOCK)
+        client, topic = self.requests.get(block=False)
+        socket = client.socket
+
+        if topic is None:
+            self.clients[socket] = client
+            self.poller.register(socket, zmq.POLLIN)
+        else:
+            socket.setsockopt(zmq.SUBSCRIBE, topic)
+
+
+    def run(self):
+
+        poll = self.poller.poll
+
+        while True:
+            sockets = poll(10000) # milliseconds
+            for active,flag in sockets:
+
+                if self.request_receive == active:
+                    self._request_incoming()
+                else:
+                    client = self.clients[active]
+
+                    # This thread is shared; one misbehaving client cannot be
+                    # allowed to halt the processing for all the others.
+
+                    try:
+                        client._pub_drain()
+                    except:
+                        print(traceback.format_exc())
+
+
+# end of class _Receiver
+
+
+
+_receiver_instance = None
+_receiver_lock = threading.Lock()
+
+
+def _receiver():
+    """ Return the :class:`_Receiver` instance shared by all :class:`Client`
+        instances, starting it if necessary. A dedicated thread per
+        :class:`Client` means one mostly idle thread, and one poll() call,
+        for every daemon a process is subscribed to.
+    """
+
+    global _receiver_instance
+
+    if _receiver_instance is None:
+        _receiver_lock.acquire()
+
+        try:
+            if _receiver_instance is None:
+                _receiver_instance = _Receiver()
+        finally:
+            _receiver_lock.release()
+
+    return _receiver_instance
+
+
+
 class Server:
     """ Send broadcasts via a ZeroMQ PUB socket. The default behavior is to
-        set up a listener on all available network interfaces on the first
+        set up a listener on all available network interfaces on an
         available automatically assigned port. The *avoid* set enumerates port
         numbers that should not be automatically assigned; this is ignored if a
         fixed *port* is specified.
@@ -247,10 +350,9 @@ class Server:
     def __init__(self, port=None, avoid=set()):
 
         self.socket = zmq_context.socket(zmq.PUB)
-        self.socket_lock = threading.Lock()
 
-        # If the port is set, use it; otherwise, look for the first available
-        # port within the default range.
+        # If the port is set, use it; otherwise, look for an available port
+        # within the default range.
 
         if port is None:
             minimum = minimum_port
@@ -260,9 +362,26 @@ class Server:
             minimum = port
             maximum = port
 
+        # The default range is large, and usually sparsely used; a few random
+        # attempts, where ZeroMQ handles the probing, will almost always find
+        # a free port much faster than walking the range one bind() at a time.
+        # The linear search below remains as the fallback.
+
+        if port is None:
+            random = self._bind_random(minimum, maximum, avoid)
+        else:
+            random = None
+
+        if random is None:
+            trial = minimum
+            searching = True
+        else:
+            trial = random
+            searching = False
+
         avoided = list()
-        trial = minimum
-        while trial <= maximum:
+
+        while searching and trial <= maximum:
             if port is None and trial in avoid:
                 avoided.append(trial)
                 trial += 1
@@ -303,6 +422,11 @@ class Server:
                 error = "no ports available in range %d:%d" % (minimum, maximum)
             else:
                 error = 'port already in use: ' + str(port)
+
+            # The caller will typically retry with a different port; don't
+            # leave this socket behind in the shared context.
+
+            self.socket.close()
             raise ConnectionError(error)
 
         self.port = trial
@@ -322,21 +446,52 @@ class Server:
         self.broadcast_receive = zmq_context.socket(zmq.PAIR)
         self.broadcast_receive.bind(internal)
 
+        # Any thread can call publish(), and a ZeroMQ socket cannot safely be
+        # used by multiple threads at once; the lock serializes the send()
+        # calls on the shared signal socket.
+
         self.broadcast_signal = zmq_context.socket(zmq.PAIR)
         self.broadcast_signal.connect(internal)
+        self.broadcast_lock = threading.Lock()
 
         self.publishing_thread = threading.Thread(target=self.run)
         self.publishing_thread.daemon = True
         self.publishing_thread.start()
 
 
+    def _bind_random(self, minimum, maximum, avoid):
+        """ Attempt to bind to a random port between *minimum* and *maximum*,
+            inclusive, that is not in the *avoid* set. Return the port number
+            if successful, otherwise return None.
+        """
+
+        for attempt in range(10):
+            try:
+                trial = self.socket.bind_to_random_port('tcp://*', minimum, maximum + 1, 10)
+            except zmq.error.ZMQBindError:
+                return None
+
+            if trial in avoid:
+                self.socket.unbind(self.socket.last_endpoint)
+                continue
+
+            return trial
+
+        return None
+
+
     def publish(self, message):
         """ A *message* is a :class:`mktl.protocol.message.Broadcast` instance
             intended for broadcast to any/all subscribers.
         """
 
         self.broadcasts.put(message)
-        self.broadcast_signal.send(b'')
+
+        self.broadcast_lock.acquire()
+        try:
+            self.broadcast_signal.send(b'')
+        finally:
+            self.broadcast_lock.release()
 
 
     def _pub_outgoing(self):
@@ -355,7 +510,12 @@ class Server:
         # from a single thread handling all send/recv calls, so the
         # lock is no longer in place.
 
-        self.socket.send_multipart(parts)
+        # Large frames, typically bulk data, are handed to ZeroMQ without a
+        # copy; the frames are immutable bytes. pyzmq still copies any frame
+        # smaller than zmq.COPY_THRESHOLD, where the zero-copy bookkeeping
+        # would cost more than the copy it avoids.
+
+        self.socket.send_multipart(parts, copy=False)
 
 
     def run(self):
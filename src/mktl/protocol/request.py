@@ -18,7 +18,16 @@ from . import message
 
 minimum_port = 10079
 maximum_port = 13679
-zmq_context = zmq.Context()
+
+# The fixed trailing parts of an ACK: the type, an empty target, no flags,
+# and an empty payload.
+
+_ack = (b'ACK', b'', b'', b'')
+
+# This is the same context instance used by the publish module; see the
+# comments there.
+
+zmq_context = zmq.Context.instance(io_threads=2)
 
 
 class Client:
@@ -64,8 +73,13 @@ class Client:
         self.request_receive = zmq_context.socket(zmq.PAIR)
         self.request_receive.bind(internal)
 
+        # Any thread can call send(), and a ZeroMQ socket cannot safely be
+        # used by multiple threads at once; the lock serializes the send()
+        # calls on the shared signal socket.
+
         self.request_signal = zmq_context.socket(zmq.PAIR)
         self.request_signal.connect(internal)
+        self.request_lock = threading.Lock()
 
         self.pending = dict()
         self.pending_thread = threading.Thread(target=self.run)
@@ -108,6 +122,12 @@ class Client:
 
         if response.type == 'ACK':
             pending._complete_ack()
+
+            # If no response is coming the ACK is the end of the exchange.
+
+            if pending.reply == False:
+                del self.pending[response.id]
+
             return
 
         pending._complete(response)
@@ -122,7 +142,13 @@ class Client:
         message = self.requests.get(block=False)
 
         parts = tuple(message)
-        self.pending[message.id] = message
+
+        # Only track requests that expect something in return; a request sent
+        # with neither an ACK nor a REP would otherwise never be removed from
+        # the pending dictionary.
+
+        if message.ack or message.reply:
+            self.pending[message.id] = message
 
         # A lock around the ZeroMQ socket is necessary in a multithreaded
         # application; otherwise, if two different threads both invoke
@@ -131,7 +157,10 @@ class Client:
         # from a single thread handling all send/recv calls, so the
         # lock is no longer in place.
 
-        self.socket.send_multipart(parts)
+        # Large frames are handed to ZeroMQ without a copy; see the same
+        # call in the publish module.
+
+        self.socket.send_multipart(parts, copy=False)
 
 
     def run(self):
@@ -162,11 +191,28 @@ class Client:
                     self._req_outgoing()
 
                 elif self.socket == active:
-                    parts = self.socket.recv_multipart()
-                    self._rep_incoming(parts)
+                    self._rep_drain()
 
 
-    def send(self, message):
+    def _rep_drain(self):
+        """ Receive and handle every response already queued on the socket,
+            so that one poll() call covers a burst of responses. The number
+            handled in one pass is capped so that outgoing requests are not
+            starved by a steady stream of responses.
+        """
+
+        receive = self.socket.recv_multipart
+
+        for ignored in range(1000):
+            try:
+                parts = receive(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+            self._rep_incoming(parts)
+
+
+    def send(self, message, wait=True):
         """ A *message* is a fully populated
             :class:`mktl.protocol.message.Request` instance,
             which normalizes the arguments that will be sent via this method
@@ -176,12 +222,23 @@ class Client:
             waiting for the full response; the caller is free to decide whether
             to block or wait for the full response, using the methods in the
             :class:`mktl.protocol.message.Request` instance.
+
+            If *wait* is False this method will not wait for the ACK either,
+            and no TimeoutError will be raised; the caller is then responsible
+            for checking :func:`mktl.protocol.message.Request.wait_ack`. This
+            allows a caller to have several requests awaiting acknowledgement
+            at the same time.
         """
 
         self.requests.put(message)
-        self.request_signal.send(b'')
 
-        if message.ack:
+        self.request_lock.acquire()
+        try:
+            self.request_signal.send(b'')
+        finally:
+            self.request_lock.release()
+
+        if message.ack and wait:
             pass
         else:
             return
@@ -283,6 +340,11 @@ class Server:
                 error = "no ports available in range %d:%d" % (minimum, maximum)
             else:
                 error = 'port already in use: ' + str(port)
+
+            # The caller will typically retry with a different port; don't
+            # leave this socket behind in the shared context.
+
+            self.socket.close()
             raise ConnectionError(error)
 
         self.port = trial
@@ -298,8 +360,12 @@ class Server:
         self.response_receive = zmq_context.socket(zmq.PAIR)
         self.response_receive.bind(internal)
 
+        # Responses are sent from the worker threads; as with the Client,
+        # the lock serializes the send() calls on the shared signal socket.
+
         self.response_signal = zmq_context.socket(zmq.PAIR)
         self.response_signal.connect(internal)
+        self.response_lock = threading.Lock()
 
         self.shutdown = False
         self.thread = threading.Thread(target=self.run)
@@ -332,10 +398,12 @@ class Server:
             request.
         """
 
-        response = message.Message('ACK', id=request.id)
-        response.prefix = request.prefix
+        # An ACK is identical for every request apart from the identity
+        # prefix and the request id; build the multipart sequence directly,
+        # rather than going through a Message instance and its _finalize().
 
-        self.send(response)
+        parts = request.prefix + (message.version, request.id) + _ack
+        self.send(parts)
 
 
     def req_handler(self, request):
@@ -434,17 +502,36 @@ class Server:
                     self._rep_outgoing()
 
                 elif self.socket == active:
-                    parts = self.socket.recv_multipart()
-                    # Calling submit() will block if a worker is not available.
-                    # Note that for high frequency operations this can result
-                    # in out-of-order handling of requests, for example, if a
-                    # stream of SET requests are inbound for a single item.
-                    self.workers.submit(self.req_incoming, parts)
+                    self._req_drain()
 
 
         self.workers.shutdown()
 
 
+    def _req_drain(self):
+        """ Receive every request already queued on the socket and hand
+            each one to the worker pool, so that one poll() call covers a
+            burst of requests. The number handled in one pass is capped so
+            that outgoing responses are not starved by a steady stream of
+            requests.
+        """
+
+        receive = self.socket.recv_multipart
+        submit = self.workers.submit
+
+        for ignored in range(1000):
+            try:
+                parts = receive(flags=zmq.NOBLOCK)
+            except zmq.Again:
+                break
+
+            # Calling submit() will block if a worker is not available.
+            # Note that for high frequency operations this can result
+            # in out-of-order handling of requests, for example, if a
+            # stream of SET requests are inbound for a single item.
+            submit(self.req_incoming, parts)
+
+
     def _rep_outgoing(self):
         """ Clear one request notification and send one pending response.
         """
@@ -453,15 +540,22 @@ class Server:
         response = self.responses.get(block=False)
 
         parts = tuple(response)
-        self.socket.send_multipart(parts)
+        self.socket.send_multipart(parts, copy=False)
 
 
     def send(self, response):
-        """ Queue a response to be sent back to the original requestor.
+        """ Queue a response to be sent back to the original requestor. The
+            *response* is typically a :class:`mktl.protocol.message.Message`
+            instance, but any sequence of message parts is acceptable.
         """
 
         self.responses.put(response)
-        self.response_signal.send(b'')
+
+        self.response_lock.acquire()
+        try:
+            self.response_signal.send(b'')
+        finally:
+            self.response_lock.release()
 
 
 # end of class Server
@@ -469,17 +563,29 @@ class Server:
 
 
 client_connections = dict()
+client_connections_lock = threading.Lock()
 
 def client(address, port):
     """ Factory function for a :class:`Client` instance. Use of this method is
         encouraged to streamline re-use of established connections.
     """
 
+    # Only one Client can exist for a given address and port, since each
+    # binds an inproc socket named after them; concurrent first requests
+    # for the same server must not both construct one.
+
     try:
         instance = client_connections[(address, port)]
     except KeyError:
-        instance = Client(address, port)
-        client_connections[(address, port)] = instance
+        client_connections_lock.acquire()
+
+        try:
+            instance = client_connections[(address, port)]
+        except KeyError:
+            instance = Client(address, port)
+            client_connections[(address, port)] = instance
+        finally:
+            client_connections_lock.release()
 
     return instance
 
@@ -132,11 +132,16 @@ class Store:
 
     def _update_catalog(self):
 
+        # Most keys are missing the first time through, which is when the
+        # store is instantiated; check membership directly rather than
+        # raising a KeyError for each one. The catalog order is retained,
+        # which is the order in which the store will iterate over its items.
+
+        items = self._items
+
         for key in self.catalog.keys():
-            try:
-                self._items[key]
-            except KeyError:
-                self._items[key] = None
+            if key not in items:
+                items[key] = None
 
 
     def values(self):
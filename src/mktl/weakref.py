@@ -16,4 +16,35 @@ def ref(thing):
         return weakref.WeakMethod(thing)
 
 
+
+def prune(references):
+    """ Remove any dead references from the supplied list, in place. This is
+        a single pass over the list, as opposed to calling list.remove() for
+        each dead reference, which is a linear search every time.
+
+        Other threads are allowed to append to the list while it is being
+        pruned: only the entries present when pruning started are inspected,
+        surviving entries are shifted down to fill the gaps, and the leftover
+        tail of that original range is deleted in one step. Anything appended
+        in the meantime lands beyond that range and is left untouched.
+    """
+
+    count = len(references)
+    kept = 0
+
+    for index in range(count):
+        reference = references[index]
+
+        if reference() is None:
+            continue
+
+        if kept != index:
+            references[kept] = reference
+
+        kept += 1
+
+    if kept != count:
+        del references[kept:count]
+
+
 # vim: set expandtab tabstop=8 softtabstop=4 shiftwidth=4 autoindent:
@@ -0,0 +1,86 @@
+import mktl
+import threading
+import time
+
+
+def test_basics():
+
+    event = mktl.protocol.message._Event()
+    assert event.is_set() == False
+
+    # A zero or negative timeout polls the event without blocking.
+
+    start = time.time()
+    assert event.wait(0) == False
+    assert event.wait(-1) == False
+    assert time.time() - start < 0.5
+
+    event.set()
+    assert event.is_set() == True
+    assert event.wait(0) == True
+    assert event.wait(-1) == True
+    assert event.wait() == True
+
+
+def test_timeout():
+
+    event = mktl.protocol.message._Event()
+
+    start = time.time()
+    assert event.wait(0.2) == False
+    elapsed = time.time() - start
+
+    assert elapsed >= 0.15
+    assert elapsed < 2
+    assert event.is_set() == False
+
+
+def test_waiters():
+
+    event = mktl.protocol.message._Event()
+    results = list()
+    results_lock = threading.Lock()
+
+    def waiter():
+        result = event.wait(10)
+        results_lock.acquire()
+        results.append(result)
+        results_lock.release()
+
+    threads = list()
+    for count in range(5):
+        thread = threading.Thread(target=waiter, daemon=True)
+        thread.start()
+        threads.append(thread)
+
+    # Give the waiters a chance to block before the event is set.
+
+    time.sleep(0.1)
+    start = time.time()
+    event.set()
+
+    for thread in threads:
+        thread.join(5)
+        assert thread.is_alive() == False
+
+    assert time.time() - start < 5
+    assert results == [True] * 5
+
+
+def test_repeat_set():
+
+    event = mktl.protocol.message._Event()
+    event.set()
+
+    # Setting the event a second time must not try to release the
+    # underlying lock again, which would raise a RuntimeError.
+
+    event.set()
+    event.set()
+
+    assert event.is_set() == True
+    assert event.wait(0) == True
+    assert event.wait(0.1) == True
+
+
+# vim: set expandtab tabstop=8 softtabstop=4 shiftwidth=4 autoindent:
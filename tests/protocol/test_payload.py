@@ -91,4 +91,18 @@ def test_origin():
     assert '_argv' in decoded
 
 
+def test_freeze():
+
+    payload = mktl.protocol.message.Payload(value=44, time=time.time())
+    payload.freeze()
+
+    encapsulated = payload.encapsulate()
+    assert encapsulated is payload.encapsulate()
+
+    decoded = mktl.json.loads(encapsulated)
+
+    assert decoded['value'] == 44
+    assert not '_encapsulated' in decoded
+
+
 # vim: set expandtab tabstop=8 softtabstop=4 shiftwidth=4 autoindent:
@@ -62,4 +62,22 @@ def test_removed_object_method():
     assert dereferenced is None
 
 
+def test_prune():
+    kept = Referenced()
+    removed = Referenced()
+
+    references = list()
+    references.append(mktl.weakref.ref(removed))
+    references.append(mktl.weakref.ref(kept.a_method))
+    references.append(mktl.weakref.ref(removed.a_method))
+    references.append(mktl.weakref.ref(kept))
+
+    del removed
+
+    mktl.weakref.prune(references)
+    assert len(references) == 2
+    assert references[0]() == kept.a_method
+    assert references[1]() is kept
+
+
 # vim: set expandtab tabstop=8 softtabstop=4 shiftwidth=4 autoindent: